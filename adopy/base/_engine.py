@@ -38,9 +38,13 @@ class Engine(object):
         self._dtype = dtype
         self._noise_ratio = noise_ratio
 
-        self._g_d = g_d = make_grid_matrix(grid_design)[task.designs]
-        self._g_p = g_p = make_grid_matrix(grid_param)[model.params]
-        self._g_y = g_y = make_grid_matrix(grid_response)[task.responses]
+        g_d = make_grid_matrix(grid_design, dtype=dtype)[task.designs]
+        g_p = make_grid_matrix(grid_param, dtype=dtype)[model.params]
+        g_y = make_grid_matrix(grid_response, dtype=dtype)[task.responses]
+
+        self._g_d = g_d
+        self._g_p = g_p
+        self._g_y = g_y
 
         self.n_d = g_d.shape[0]
         self.n_p = g_p.shape[0]
@@ -306,9 +310,9 @@ class Engine(object):
         """
         Reset the engine as in the initial state.
         """
-        self._log_lik = None
+        # The log likelihood and the entropy depend only on the grids and the
+        # model, which do not change, so they are kept to avoid recomputing.
         self._marg_log_lik = None
-        self._ent = None
         self._ent_marg = None
         self._ent_cond = None
         self._mutual_info = None
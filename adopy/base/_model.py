@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-from functools import reduce
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
@@ -175,8 +174,11 @@ class Model(object):
         if self._func is not None:
             return self._func(*args, **kargs)
 
-        # If no function is provided, generate a random log probability.
-        return np.log(np.random.rand())
+        # If no function is provided, generate random log probabilities with
+        # the broadcast shape of the arguments, without computing on them.
+        values = args + tuple(kargs.values())
+        shape = np.broadcast(*values).shape if values else ()
+        return np.log(np.random.rand(*shape))
 
     def __repr__(self) -> str:
         strs: List[str] = []
@@ -1,5 +1,4 @@
-from typing import Any, Iterable
-from collections import OrderedDict
+from typing import Any, Dict, Iterable
 
 import numpy as np
 import pandas as pd
@@ -14,7 +13,7 @@ __all__ = [
 
 
 def extract_vars_from_data(data: data_like,
-                           keys: Iterable[str]) -> 'OrderedDict[str, Any]':
+                           keys: Iterable[str]) -> Dict[str, Any]:
     """
     Extract variables corresponding to given keys from the data. The data can
     be a dictionary, an ``OrderedDict``, or a pandas.DataFrame.
@@ -23,13 +22,13 @@ def extract_vars_from_data(data: data_like,
     --------
     >>> data = {'x': [1, 2, 3], 'y': [4, 5, 6], 'z': [7, 8, 9]}
     >>> extract_vars_from_data(data, ['x', 'y'])
-    OrderedDict([('x', [1, 2, 3]), ('y', [4, 5, 6])])
+    {'x': [1, 2, 3], 'y': [4, 5, 6]}
     >>> extract_vars_from_data(data, ['a'])
     Traceback (most recent call last):
         ...
     RuntimeError: key 'a' is not available.
     """
-    ret = OrderedDict()  # type: OrderedDict[str, Any]
+    ret = {}  # type: Dict[str, Any]
     for k in keys:
         if k not in data:
             raise RuntimeError("key '{}' is not available.".format(k))
@@ -64,4 +63,4 @@ def expand_multiple_dims(x: np.ndarray, pre: int, post: int) -> np.ndarray:
 def make_vector_shape(n: int, axis: int = 0) -> np.ndarray:
     ret = np.ones(n)
     ret[axis] = -1
-    return ret.astype(np.int)
+    return ret.astype(int)
@@ -6,13 +6,12 @@ parameters: *guess rate* :math:`\gamma`, *lapse rate* :math:`\delta`,
 *threshold* :math:`\alpha`, and *slope* :math:`\beta`.
 """
 import numpy as np
-from scipy.stats import bernoulli, gumbel_l, norm
-from scipy.special import expit as inv_logit
+import pandas as pd
+from scipy.stats import bernoulli
+from scipy.special import expit, ndtr
 
 from adopy.base import Engine, Model, Task
-from adopy.functions import (
-    const_01, const_positive, get_nearest_grid_index,
-)
+from adopy.functions import const_01, const_positive
 from adopy.types import integer_like
 
 __all__ = [
@@ -20,6 +19,21 @@ __all__ = [
 ]
 
 
+def _gumbel_l_cdf(x, out=None):
+    r"""
+    Cumulative distribution function of the left-skewed Gumbel,
+    :math:`1 - \exp(-\exp(x))`. Like a ufunc, the result is written into
+    ``out`` if given, so it can be evaluated without temporary arrays.
+    """
+    if out is None:
+        out = np.empty_like(x, dtype=np.result_type(x, 1.0))
+    np.exp(x, out=out)
+    np.negative(out, out=out)
+    np.expm1(out, out=out)
+    np.negative(out, out=out)
+    return out
+
+
 class Task2AFC(Task):
     """
     The Task class for a simple 2-Alternative Forced Choice (2AFC) task
@@ -50,15 +64,35 @@ class Task2AFC(Task):
 
 
 class _ModelPsi(Model):
+    # Task objects are immutable, so all Psi models share a single instance.
+    _TASK = Task2AFC()
+
     def __init__(self, name):
         super(_ModelPsi, self).__init__(
             name=name,
-            task=Task2AFC(),
+            task=_ModelPsi._TASK,
             params=['threshold', 'slope', 'guess_rate', 'lapse_rate'],
         )
 
     def _compute_prob(self, func, st, th, sl, gr, lr):
-        return gr + (1 - gr - lr) * func(sl * (st - th))
+        # Allocate a single buffer with the final broadcast shape and update
+        # it in place, rather than creating a temporary for each operation.
+        z = np.empty(np.broadcast(st, th, sl, gr, lr).shape,
+                     dtype=np.result_type(st, th, sl, gr, lr, 1.0))
+        np.subtract(st, th, out=z)
+        np.multiply(sl, z, out=z)
+
+        # Evaluate the link function directly into the buffer.
+        p = func(z, out=z)
+
+        # Compute the scale on a fresh array, not to modify given grids.
+        scale = np.empty(np.broadcast(gr, lr).shape, dtype=z.dtype)
+        np.subtract(1.0, gr, out=scale)
+        np.subtract(scale, lr, out=scale)
+
+        p *= scale
+        p += gr
+        return p
 
 
 class ModelLogistic(_ModelPsi):
@@ -99,7 +133,7 @@ class ModelLogistic(_ModelPsi):
 
     def compute(self, choice, stimulus, guess_rate, lapse_rate, threshold, slope):
         p_obs = self._compute_prob(
-            inv_logit, stimulus, threshold, slope, guess_rate, lapse_rate)
+            expit, stimulus, threshold, slope, guess_rate, lapse_rate)
         return bernoulli.logpmf(choice, p_obs)
 
 
@@ -142,7 +176,7 @@ class ModelWeibull(_ModelPsi):
 
     def compute(self, choice, stimulus, guess_rate, lapse_rate, threshold, slope):
         p_obs = self._compute_prob(
-            gumbel_l.cdf, stimulus, threshold, slope, guess_rate, lapse_rate)
+            _gumbel_l_cdf, stimulus, threshold, slope, guess_rate, lapse_rate)
         return bernoulli.logpmf(choice, p_obs)
 
 
@@ -186,7 +220,7 @@ class ModelProbit(_ModelPsi):
 
     def compute(self, choice, stimulus, guess_rate, lapse_rate, threshold, slope):
         p_obs = self._compute_prob(
-            norm.cdf, stimulus, threshold, slope, guess_rate, lapse_rate)
+            ndtr, stimulus, threshold, slope, guess_rate, lapse_rate)
         return bernoulli.logpmf(choice, p_obs)
 
 
@@ -199,7 +233,7 @@ class EnginePsi(Engine):
     def __init__(self, model, grid_design, grid_param, d_step: int = 1, **kwargs):
         if not isinstance(model.task, Task2AFC):
             raise RuntimeError(
-                'The model should be implemented for the CRA task.')
+                'The model should be implemented for the 2AFC task.')
 
         grid_response = {'choice': [0, 1]}
 
@@ -212,6 +246,11 @@ class EnginePsi(Engine):
             **kwargs
         )
 
+        # Cache the design grid as an array to select rows without pandas
+        # indexing on every trial.
+        self._grid_design_np = self.grid_design.to_numpy()
+        self._grid_columns = self.grid_design.columns
+
         self.idx_opt = np.random.randint(self.n_d)
         self.y_obs_prev = 1
         self.d_step = d_step
@@ -225,7 +264,7 @@ class EnginePsi(Engine):
 
     @d_step.setter
     def d_step(self, value: integer_like):
-        if not isinstance(value, (int, np.int)) or value <= 0:
+        if not isinstance(value, (int, np.integer)) or value <= 0:
             raise ValueError('d_step should be an positive integer.')
         self._d_step = int(value)
 
@@ -263,28 +302,26 @@ class EnginePsi(Engine):
         self._update_mutual_info()
 
         if kind == 'optimal':
-            ret = self.grid_design.iloc[np.argmax(self.mutual_info)]
+            idx = np.argmax(self.mutual_info)
 
         elif kind == 'staircase':
             if self.y_obs_prev == 1:
                 idx = max(0, self.idx_opt - self.d_step)
             else:
-                idx = min(len(self.grid_design) - 1,
-                          self.idx_opt + (self.d_step * 2))
-
-            ret = self.grid_design.iloc[np.int(idx)]
+                idx = min(self.n_d - 1, self.idx_opt + (self.d_step * 2))
 
         elif kind == 'random':
             idx = np.random.randint(self.n_d)
-            ret = self.grid_design.iloc[idx]
 
         else:
             raise RuntimeError('An invalid kind of design: "{}".'.format(type))
 
-        self.idx_opt = get_nearest_grid_index(
-            ret.values, self.grid_design.values)
+        # The index of the chosen design is already known in every branch,
+        # so there is no need to search for it on the grid.
+        self.idx_opt = int(idx)
 
-        return ret
+        return pd.Series(self._grid_design_np[self.idx_opt],
+                         index=self._grid_columns, name=self.idx_opt)
 
     def update(self, design, response):
         super(EnginePsi, self).update(design, response)
@@ -206,5 +206,33 @@ def test_engine_multiple_update(engine):
         pytest.fail('Failed to update multiple observations.')
 
 
+def test_engine_reset(engine):
+    log_lik = engine.log_lik
+    ent = engine.ent
+    mutual_info = np.copy(engine.mutual_info)
+
+    engine.update(engine.get_design(), {'choice': 1})
+    engine.reset()
+
+    assert engine.log_lik is log_lik
+    assert engine.ent is ent
+    assert np.allclose(engine.mutual_info, mutual_info)
+
+
+def test_engine_without_func(task, grid_design, grid_param, grid_response):
+    model = Model(task=task,
+                  params=['guess_rate', 'lapse_rate', 'threshold', 'slope'])
+    engine = Engine(task=task,
+                    model=model,
+                    grid_design=grid_design,
+                    grid_param=grid_param,
+                    grid_response=grid_response)
+
+    assert engine.log_lik.shape == (engine.n_d, engine.n_p, engine.n_y)
+
+    design = engine.get_design()
+    engine.update(design, {'choice': 1})
+
+
 if __name__ == '__main__':
     pytest.main(__file__)
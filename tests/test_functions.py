@@ -1,8 +1,10 @@
 import numpy as np
+import pandas as pd
 import pytest
 
 from adopy.functions import (
-    expand_multiple_dims, get_nearest_grid_index, marginalize,
+    expand_multiple_dims, extract_vars_from_data,
+    get_nearest_grid_index, marginalize,
 )
 
 
@@ -36,5 +38,23 @@ def test_expand_multiple_dims():
     assert expand_multiple_dims(y, 3, 2).shape == (1, 1, 1, 3, 4, 1, 1)
 
 
+def test_extract_vars_from_data():
+    data = pd.DataFrame({'n': [1, 2, 3], 'x': [.5, 1.5, 2.5],
+                         's': ['a', 'b', 'c']})
+
+    ret = extract_vars_from_data(data, ['x', 'n', 's'])
+    assert list(ret.keys()) == ['x', 'n', 's']
+
+    # Each column should keep its own dtype.
+    assert ret['n'].dtype == data['n'].dtype
+    assert ret['x'].dtype == data['x'].dtype
+    assert ret['s'].dtype == data['s'].dtype
+    assert np.array_equal(ret['n'], [1, 2, 3])
+    assert np.array_equal(ret['x'], [.5, 1.5, 2.5])
+
+    with pytest.raises(RuntimeError):
+        extract_vars_from_data(data, ['a'])
+
+
 if __name__ == '__main__':
     pytest.main()
@@ -1,5 +1,7 @@
 import numpy as np
 import pytest
+from scipy.special import expit
+from scipy.stats import bernoulli, gumbel_l, norm
 
 from adopy.tasks.psi import ModelLogistic, ModelWeibull, ModelProbit, EnginePsi
 
@@ -32,5 +34,92 @@ def test_classes(design_type, model, grid_design, grid_param, response):
     psi.update(d, response)
 
 
+def test_engine_dtype(grid_design, grid_param):
+    psi = EnginePsi(model=ModelLogistic(),
+                    grid_design=grid_design, grid_param=grid_param)
+    assert (psi.grid_design.dtypes == np.float32).all()
+    assert (psi.grid_param.dtypes == np.float32).all()
+    assert psi.log_lik.dtype == np.float32
+
+    psi = EnginePsi(model=ModelLogistic(), dtype=np.float64,
+                    grid_design=grid_design, grid_param=grid_param)
+    assert (psi.grid_design.dtypes == np.float64).all()
+    assert (psi.grid_param.dtypes == np.float64).all()
+    assert psi.log_lik.dtype == np.float64
+
+
+@pytest.mark.parametrize('design_type', ['optimal', 'random'])
+def test_get_design_idx_opt(design_type, grid_design, grid_param):
+    psi = EnginePsi(model=ModelLogistic(),
+                    grid_design=grid_design, grid_param=grid_param)
+    d = psi.get_design(design_type)
+
+    if design_type == 'optimal':
+        assert psi.idx_opt == np.argmax(psi.mutual_info)
+    assert np.array_equal(d.values, psi.grid_design.iloc[psi.idx_opt].values)
+
+
+@pytest.mark.parametrize('idx_prev, y_obs_prev, idx_expected', [
+    (10, 1, 8),
+    (10, 0, 14),
+    (1, 1, 0),
+    (0, 1, 0),
+    (17, 0, 19),
+    (19, 0, 19),
+])
+def test_get_design_staircase(grid_design, grid_param,
+                              idx_prev, y_obs_prev, idx_expected):
+    psi = EnginePsi(model=ModelLogistic(), d_step=2,
+                    grid_design=grid_design, grid_param=grid_param)
+    assert psi.n_d == 20
+
+    psi.idx_opt = idx_prev
+    psi.y_obs_prev = y_obs_prev
+    d = psi.get_design('staircase')
+
+    assert psi.idx_opt == idx_expected
+    assert np.array_equal(d.values, psi.grid_design.iloc[idx_expected].values)
+
+
+@pytest.mark.parametrize('model, cdf', [
+    (ModelLogistic, expit),
+    (ModelWeibull, gumbel_l.cdf),
+    (ModelProbit, norm.cdf),
+])
+@pytest.mark.parametrize('dtype, rtol', [
+    (np.float32, 1e-5),
+    (np.float64, 1e-12),
+])
+def test_compute(model, cdf, dtype, rtol):
+    stimulus = np.linspace(-3, 3, 7, dtype=dtype).reshape(-1, 1, 1)
+    threshold = np.linspace(-1, 1, 3, dtype=dtype).reshape(1, -1, 1)
+    slope = np.array([0.5, 2.], dtype=dtype).reshape(1, 1, -1)
+    guess_rate = dtype(0.5)
+    lapse_rate = dtype(0.05)
+
+    st, th, sl = (x.astype(np.float64) for x in (stimulus, threshold, slope))
+    p = 0.5 + (1 - 0.5 - 0.05) * cdf(sl * (st - th))
+
+    for choice in [0, 1]:
+        ret = model().compute(choice=choice, stimulus=stimulus,
+                              guess_rate=guess_rate, lapse_rate=lapse_rate,
+                              threshold=threshold, slope=slope)
+        assert np.shape(ret) == (7, 3, 2)
+        assert np.allclose(ret, bernoulli.logpmf(choice, p),
+                           rtol=rtol, atol=0)
+
+
+def test_compute_mixed_dtypes():
+    ret = ModelLogistic().compute(
+        choice=1, stimulus=np.array([1.]), guess_rate=np.array([0]),
+        lapse_rate=np.array([.05]), threshold=np.array([0.]),
+        slope=np.array([1.]))
+    assert np.allclose(ret, np.log(0.95 * expit(1.)))
+
+    ret = ModelLogistic().compute(choice=1, stimulus=1., guess_rate=0,
+                                  lapse_rate=.05, threshold=0., slope=1.)
+    assert np.allclose(ret, np.log(0.95 * expit(1.)))
+
+
 if __name__ == '__main__':
     pytest.main()